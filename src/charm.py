@@ -4,18 +4,21 @@
 
 """Spring Boot Charm service."""
 
+import functools
 import json
 import logging
 import re
+import shlex
 import typing
 
 import kubernetes.client
 import ops.charm
 from charms.nginx_ingress_integrator.v0.ingress import IngressRequires
 from ops.charm import CharmBase, CharmEvents, EventBase
+from ops.framework import StoredState
 from ops.main import main
 from ops.model import ActiveStatus, BlockedStatus, MaintenanceStatus, WaitingStatus
-from ops.pebble import ExecError
+from ops.pebble import APIError, ExecError, Layer
 
 from charm_types import ExecResult
 from exceptions import ReconciliationError
@@ -24,6 +27,18 @@ from java_application import BuildpackApplication, ExecutableJarApplication
 logger = logging.getLogger(__name__)
 
 JAVA_TOOL_OPTIONS = "JAVA_TOOL_OPTIONS"
+HUMAN_READABLE_UNIT_SHIFTS = {
+    "k": 10,
+    "K": 10,
+    "m": 20,
+    "M": 20,
+    "g": 30,
+    "G": 30,
+    "t": 40,
+    "T": 40,
+}
+JAVA_HEAP_INITIAL_MEMORY_PATTERN = re.compile("(?:^|\\s)-Xms(\\d+[kmgtKMGT]?)\\b")
+JAVA_HEAP_MAXIMUM_MEMORY_PATTERN = re.compile("(?:^|\\s)-Xmx(\\d+[kmgtKMGT]?)\\b")
 
 
 class SpringBootCharm(CharmBase):
@@ -34,6 +49,7 @@ class SpringBootCharm(CharmBase):
     """
 
     on = CharmEvents()
+    _stored = StoredState()
 
     def __init__(self, *args: typing.Any) -> None:
         """Initialize the instance.
@@ -42,6 +58,10 @@ class SpringBootCharm(CharmBase):
             args: passthrough to CharmBase.
         """
         super().__init__(*args)
+        self._application_config_cache: typing.Optional[typing.Tuple[str, dict]] = None
+        self._java_application: ExecutableJarApplication | BuildpackApplication | None = None
+        self._spring_boot_container_memory_constraint: typing.Optional[int] = None
+        self._stored.set_default(validated_jvm_config=None)
         self.framework.observe(self.on.config_changed, self.reconciliation)
         self.framework.observe(self.on.spring_boot_app_pebble_ready, self.reconciliation)
         self.ingress = IngressRequires(self, self._nginx_ingress_config())
@@ -52,12 +72,14 @@ class SpringBootCharm(CharmBase):
         Returns:
             A dictionary containing the ingress configuration.
         """
+        charm_config = self.model.config
+        app_name = self.app.name
         config = {
-            "service-hostname": self.model.config["ingress-hostname"] or self.app.name,
-            "service-name": self.app.name,
+            "service-hostname": charm_config["ingress-hostname"] or app_name,
+            "service-name": app_name,
             "service-port": str(self._spring_boot_port()),
         }
-        remove_prefix = self.model.config["ingress-strip-url-prefix"]
+        remove_prefix = charm_config["ingress-strip-url-prefix"]
         if remove_prefix:
             config.update(
                 {
@@ -71,6 +93,9 @@ class SpringBootCharm(CharmBase):
     def _application_config(self) -> dict | None:
         """Decode the value of the charm configuration application-config.
 
+        The decoded value is cached on the charm instance together with the raw configuration
+        string, so repeated calls within the same hook only decode the JSON once.
+
         Returns:
             The value of the charm configuration application-config.
 
@@ -81,8 +106,11 @@ class SpringBootCharm(CharmBase):
             config = self.model.config["application-config"]
             if not config:
                 return None
+            if self._application_config_cache and self._application_config_cache[0] == config:
+                return self._application_config_cache[1]
             application_config = json.loads(config)
             if isinstance(application_config, dict):
+                self._application_config_cache = (config, application_config)
                 return application_config
             logger.error("Invalid application-config value: %s", repr(config))
             raise ReconciliationError(
@@ -106,23 +134,19 @@ class SpringBootCharm(CharmBase):
                 invalid.
         """
         application_config = self._application_config()
-        if (
-            application_config
-            and "server" in application_config
-            and isinstance(application_config["server"], dict)
-            and application_config["server"]["port"]
-        ):
-            port = application_config["server"]["port"]
-            if not isinstance(port, int) or port <= 0:
-                logger.error("Invalid server port configuration: %s", repr(port))
-                raise ReconciliationError(
-                    new_status=BlockedStatus("Invalid server port configuration")
-                )
-            logger.debug(
-                "Port configuration detected in application-config, update server port to %s", port
+        server = application_config.get("server") if application_config else None
+        port = server.get("port") if isinstance(server, dict) else None
+        if not port:
+            return 8080
+        if not isinstance(port, int) or port <= 0:
+            logger.error("Invalid server port configuration: %s", repr(port))
+            raise ReconciliationError(
+                new_status=BlockedStatus("Invalid server port configuration")
             )
-            return port
-        return 8080
+        logger.debug(
+            "Port configuration detected in application-config, update server port to %s", port
+        )
+        return port
 
     def _exec(
         self, command: list[str], environment: typing.Optional[typing.Dict[str, str]] = None
@@ -136,7 +160,7 @@ class SpringBootCharm(CharmBase):
         Returns:
             A 3-tuple of exit code, stdout and stderr.
         """
-        container = self._spring_boot_container()
+        container = self._spring_boot_container
         process = container.exec(command, environment=environment, timeout=60)
         try:
             stdout, stderr = process.wait_output()
@@ -150,7 +174,8 @@ class SpringBootCharm(CharmBase):
         """Parse numbers with human-readable units like K, M and G.
 
         Args:
-            number_with_unit: input string, something like ``"1G"`` or ``"33m"``.
+            number_with_unit: input string, something like ``"1G"`` or ``"33m"``, units are
+                case-insensitive.
 
         Returns:
             Parsed result, as an integer.
@@ -158,36 +183,37 @@ class SpringBootCharm(CharmBase):
         Raises:
             ValueError: when the input number is invalid.
         """
-        number_with_unit = number_with_unit.lower()
-        unit = number_with_unit[-1]
-        unit_scale = {"k": 2**10, "m": 2**20, "g": 2**30}
-        if unit not in unit_scale:
+        unit_shift = HUMAN_READABLE_UNIT_SHIFTS.get(number_with_unit[-1])
+        if unit_shift is None:
             try:
                 return int(number_with_unit)
             except ValueError as exc:
                 raise ValueError(f"Unknown human-readable unit: {repr(number_with_unit)}") from exc
         digits = number_with_unit[:-1]
-        return int(digits) * unit_scale[unit]
+        return int(digits) << unit_shift
 
-    def _regex_find_last(self, pattern: str, string: str, default: str) -> str:
+    def _regex_find_last(self, pattern: re.Pattern, string: str, default: str) -> str:
         """Match the last regex capturing group in the input string.
 
         Args:
-            pattern: regular expression pattern.
+            pattern: compiled regular expression pattern.
             string: input string
             default: default value if no match is found.
 
         Return:
             The last matching capturing group in the input string, or ``default`` if not found.
         """
-        matches = re.findall(pattern, string)
-        if not matches:
-            return default
-        return matches[-1]
+        last = default
+        for match in pattern.finditer(string):
+            last = match.group(1)
+        return last
 
     def _jvm_config(self) -> str:
         """Get and verify the JVM parameters defined in the charm configuration jvm-config.
 
+        The java dry run validation result is kept in the charm stored state, so the java dry run
+        is skipped in later hooks for the same jvm-config and the same launch command.
+
         Returns:
             JVM command line arguments as a string.
 
@@ -198,10 +224,10 @@ class SpringBootCharm(CharmBase):
         if not config:
             return ""
         java_heap_initial_memory = self._parse_human_readable_units(
-            self._regex_find_last("(?:^|\\s)-Xms(\\d+[kmgtKMGT]?)\\b", config, "0")
+            self._regex_find_last(JAVA_HEAP_INITIAL_MEMORY_PATTERN, config, "0")
         )
         java_heap_maximum_memory = self._parse_human_readable_units(
-            self._regex_find_last("(?:^|\\s)-Xmx(\\d+[kmgtKMGT]?)\\b", config, "0")
+            self._regex_find_last(JAVA_HEAP_MAXIMUM_MEMORY_PATTERN, config, "0")
         )
         container_memory_limit = self._get_spring_boot_container_memory_constraint()
         if (
@@ -217,24 +243,34 @@ class SpringBootCharm(CharmBase):
         java_app = self._detect_java_application()
         command = java_app.command()
         command.insert(1, "--dry-run")
+        validation_key = shlex.join([*command, config])
+        if validation_key == self._stored.validated_jvm_config:
+            logger.debug("jvm-config has been validated before, skip the java dry run")
+            return config
         exit_code, _, stderr = self._exec(command, environment={JAVA_TOOL_OPTIONS: config})
         if exit_code != 0:
             logger.error(
                 "Invalid JVM configuration, error report from java command %s: %s", command, stderr
             )
             raise ReconciliationError(new_status=BlockedStatus("Invalid jvm-config"))
+        self._stored.validated_jvm_config = validation_key
         return config
 
     def _spring_boot_env(self) -> typing.Dict[str, str]:
         """Generate environment variables for the Spring Boot application process.
 
+        The application-config is serialized in a canonical form (sorted keys, no whitespace), so
+        semantically equal configurations generate identical pebble layers.
+
         Returns:
             Environment variables for the Spring Boot application.
         """
         env = {}
         application_config = self._application_config()
         if application_config:
-            env["SPRING_APPLICATION_JSON"] = json.dumps(self._application_config())
+            env["SPRING_APPLICATION_JSON"] = json.dumps(
+                application_config, sort_keys=True, separators=(",", ":")
+            )
         jvm_config = self._jvm_config()
         if jvm_config:
             env[JAVA_TOOL_OPTIONS] = jvm_config
@@ -243,6 +279,8 @@ class SpringBootCharm(CharmBase):
     def _detect_java_application(self) -> ExecutableJarApplication | BuildpackApplication:
         """Detect the type of the Java application inside the Spring Boot application image.
 
+        The detection result is cached until the next reconciliation.
+
         Returns:
             One of the subclasses of :class:`java_application.JavaApplicationBase` represents
             one Java application type.
@@ -252,28 +290,38 @@ class SpringBootCharm(CharmBase):
                 detection process, requiring the main reconciliation process to terminate the
                 reconciliation early.
         """
-        container = self._spring_boot_container()
+        if self._java_application is not None:
+            return self._java_application
+        container = self._spring_boot_container
         if container.exists(
             "/layers/paketo-buildpacks_bellsoft-liberica/jre/bin/java"
         ) and container.exists("/workspace/org/springframework/boot/loader/JarLauncher.class"):
-            return BuildpackApplication()
-        if container.isdir("/app"):
-            files_in_app = container.list_files("/app")
-            jar_files = [file.name for file in files_in_app if file.name.endswith(".jar")]
-            if not jar_files:
-                raise ReconciliationError(new_status=BlockedStatus("No jar file found in /app"))
-            if len(jar_files) > 1:
-                logger.error("Multiple jar files found in /app: %s", repr(jar_files))
-                raise ReconciliationError(
-                    new_status=BlockedStatus("Multiple jar files found in /app")
-                )
-            jar_file = jar_files[0]
-            return ExecutableJarApplication(executable_jar_path=f"/app/{jar_file}")
-        raise ReconciliationError(new_status=BlockedStatus("Unknown Java application type"))
-
+            self._java_application = BuildpackApplication()
+            return self._java_application
+        try:
+            jar_files = [file.name for file in container.list_files("/app", pattern="*.jar")]
+        except APIError as exc:
+            if exc.code != 404:
+                raise
+            raise ReconciliationError(
+                new_status=BlockedStatus("Unknown Java application type")
+            ) from exc
+        if not jar_files:
+            raise ReconciliationError(new_status=BlockedStatus("No jar file found in /app"))
+        if len(jar_files) > 1:
+            logger.error("Multiple jar files found in /app: %s", repr(jar_files))
+            raise ReconciliationError(new_status=BlockedStatus("Multiple jar files found in /app"))
+        jar_file = jar_files[0]
+        self._java_application = ExecutableJarApplication(executable_jar_path=f"/app/{jar_file}")
+        return self._java_application
+
+    @functools.cached_property
     def _spring_boot_container(self) -> ops.model.Container:
         """Retrieve the container for the Spring Boot application.
 
+        The container is cached on the charm instance after the first successful pebble
+        connectivity check, later accesses on the same charm instance don't check it again.
+
         Returns:
             An instance of :class:`ops.charm.Container` represents the Spring Boot container.
 
@@ -301,7 +349,7 @@ class SpringBootCharm(CharmBase):
                     "override": "replace",
                     "summary": "Spring Boot application service",
                     "environment": self._spring_boot_env(),
-                    "command": " ".join(command),
+                    "command": shlex.join(command),
                     "startup": "enabled",
                 }
             },
@@ -316,9 +364,22 @@ class SpringBootCharm(CharmBase):
             },
         }
 
+    @functools.cached_property
+    def _kubernetes_client(self) -> kubernetes.client.CoreV1Api:
+        """Create the Kubernetes API client from the in-cluster configuration.
+
+        Returns:
+            An instance of :class:`kubernetes.client.CoreV1Api`.
+        """
+        kubernetes.config.load_incluster_config()
+        return kubernetes.client.CoreV1Api()
+
     def _get_spring_boot_container_memory_constraint(self) -> typing.Optional[int]:
         """Get the spring-boot-app container memory limit.
 
+        The pod resource limits can't change during the lifetime of the pod, so the result is
+        cached on the charm instance.
+
         Return:
             The memory limit of the spring-boot-app container in number of bytes. ``None`` if
             there's no limit.
@@ -327,31 +388,60 @@ class SpringBootCharm(CharmBase):
             RuntimeError: Container spring-boot-app does not exist, it shouldn't happen since
                 this function checks the existence of the spring-boot-app first.
         """
+        if self._spring_boot_container_memory_constraint is not None:
+            return self._spring_boot_container_memory_constraint
         # ensure that the Spring Boot container is up
-        self._spring_boot_container()
-        kubernetes.config.load_incluster_config()
-        client = kubernetes.client.CoreV1Api()
-        spec: kubernetes.client.V1PodSpec = client.read_namespaced_pod(
+        _ = self._spring_boot_container
+        spec: kubernetes.client.V1PodSpec = self._kubernetes_client.read_namespaced_pod(
             name=self.unit.name.replace("/", "-"), namespace=self.model.name
         ).spec
-        container = next(
-            (container for container in spec.containers if container.name == "spring-boot-app"),
-            None,
-        )
+        containers = {container.name: container for container in spec.containers}
+        container = containers.get("spring-boot-app")
         if container is None:
             raise RuntimeError("Container spring-boot-app does not exist")
         limits = container.resources.limits
-        if limits is None:
-            return 0
-        memory_limit = container.resources.limits.get("memory")
-        if memory_limit is None:
-            return 0
-        return self._parse_human_readable_units(memory_limit.removesuffix("i"))
+        memory_limit = limits.get("memory") if limits is not None else None
+        self._spring_boot_container_memory_constraint = (
+            0
+            if memory_limit is None
+            else self._parse_human_readable_units(memory_limit.removesuffix("i"))
+        )
+        return self._spring_boot_container_memory_constraint
+
+    def _ingress_reconciliation(self) -> None:
+        """Run the reconciliation process for the ingress relation.
+
+        The ingress relation data is only updated when it differs from the current ingress
+        configuration, to avoid writing unchanged relation data on every reconciliation.
+        """
+        ingress_config = self._nginx_ingress_config()
+        relation = self.model.get_relation("ingress")
+        if (
+            relation is not None
+            and self.unit.is_leader()
+            and all(
+                relation.data[self.app].get(key) == value for key, value in ingress_config.items()
+            )
+        ):
+            logger.debug("Ingress configuration unchanged, skip updating ingress relation data")
+            return
+        self.ingress.update_config(ingress_config)
 
     def _service_reconciliation(self) -> None:
-        """Run the reconciliation process for pebble services."""
-        container = self._spring_boot_container()
-        container.add_layer("spring-boot-app", self._generate_spring_boot_layer(), combine=True)
+        """Run the reconciliation process for pebble services.
+
+        The pebble layer is only applied when its services or checks differ from the current
+        pebble plan.
+        """
+        container = self._spring_boot_container
+        layer = Layer(self._generate_spring_boot_layer())
+        plan = container.get_plan()
+        if all(
+            plan.services.get(name) == service for name, service in layer.services.items()
+        ) and all(plan.checks.get(name) == check for name, check in layer.checks.items()):
+            logger.debug("Spring Boot pebble layer unchanged, skip replan")
+            return
+        container.add_layer("spring-boot-app", layer, combine=True)
         container.replan()
 
     def reconciliation(self, event: EventBase) -> None:
@@ -362,8 +452,9 @@ class SpringBootCharm(CharmBase):
         """
         try:
             logger.debug("Start reconciliation, triggered by %s", event)
+            self._java_application = None
             self.unit.status = MaintenanceStatus("Start reconciliation process")
-            self.ingress.update_config(self._nginx_ingress_config())
+            self._ingress_reconciliation()
             self._service_reconciliation()
             self.unit.status = ActiveStatus()
             logger.debug("Finish reconciliation, triggered by %s", event)
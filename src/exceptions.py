@@ -20,5 +20,6 @@ class ReconciliationError(Exception):
             defer_event: if true, defer the event that triggers the reconciliation error and retry
                 the reconciliation process later.
         """
+        super().__init__()
         self.new_status = new_status
         self.defer_event = defer_event
@@ -11,6 +11,8 @@ import abc
 class JavaApplicationBase(abc.ABC):
     """The interface class for all Java application abstractions."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def command(self) -> list[str]:
         """Generate the pebble command to start the Java application."""
@@ -19,6 +21,8 @@ class JavaApplicationBase(abc.ABC):
 class ExecutableJarApplication(JavaApplicationBase):
     """ExecutableJarApplication represents the Java application with a single executable jar."""
 
+    __slots__ = ("executable_jar_path", "_command")
+
     def __init__(self, executable_jar_path: str):
         """Initialize the ExecutableJarApplication instance.
 
@@ -26,6 +30,7 @@ class ExecutableJarApplication(JavaApplicationBase):
             executable_jar_path: the path to the executable jar file.
         """
         self.executable_jar_path = executable_jar_path
+        self._command = ("java", "-jar", executable_jar_path)
 
     def command(self) -> list[str]:
         """Generate the pebble command to start the Java application.
@@ -33,12 +38,14 @@ class ExecutableJarApplication(JavaApplicationBase):
         Returns:
             the pebble command to start the Java application.
         """
-        return ["java", "-jar", self.executable_jar_path]
+        return list(self._command)
 
 
 class BuildpackApplication(JavaApplicationBase):
     """BuildpackApplication represents the Java application image created with buildpack."""
 
+    __slots__ = ("class_path", "java_executable_path", "_command")
+
     def __init__(
         self,
         class_path: str = "/workspace",
@@ -52,6 +59,12 @@ class BuildpackApplication(JavaApplicationBase):
         """
         self.class_path = class_path
         self.java_executable_path = java_executable_path
+        self._command = (
+            java_executable_path,
+            "-cp",
+            class_path,
+            "org.springframework.boot.loader.JarLauncher",
+        )
 
     def command(self) -> list[str]:
         """Generate the command to start the Java application in a buildpack created image.
@@ -59,9 +72,4 @@ class BuildpackApplication(JavaApplicationBase):
         Returns:
             the pebble command to start the Java application.
         """
-        return [
-            self.java_executable_path,
-            "-cp",
-            self.class_path,
-            "org.springframework.boot.loader.JarLauncher",
-        ]
+        return list(self._command)
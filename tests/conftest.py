@@ -8,3 +8,5 @@ import pytest
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Define some command line options for integration and unit tests."""
     parser.addoption("--spring-boot-app-image", action="store")
+    parser.addoption("--charm-file", action="store")
+    parser.addoption("--charm-cache", action="store_true")
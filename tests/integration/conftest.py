@@ -2,21 +2,99 @@
 # See LICENSE file for licensing details.
 
 """Test fixtures for Spring Boot charm integration tests."""
+import asyncio
+import hashlib
+import pathlib
+import shutil
+import time
 import typing
 
+import pytest
 import pytest_asyncio
 import pytest_operator.plugin
 
+STATUS_CACHE_TTL = 2.0
+CHARM_CACHE_DIR = pathlib.Path.home() / ".cache" / "spring-boot-k8s-operator"
+CHARM_SOURCES = ("charmcraft.yaml", "config.yaml", "metadata.yaml", "requirements.txt")
+CHARM_SOURCE_DIRS = ("lib", "src")
+
+
+@pytest.fixture(scope="session", name="charm_file")
+def charm_file_fixture(pytestconfig: pytest.Config) -> typing.Optional[str]:
+    """Path to a pre-built Spring Boot charm file shared by all test modules, if provided."""
+    return pytestconfig.getoption("--charm-file")
+
+
+def _charm_source_digest(root: pathlib.Path) -> str:
+    """Calculate a digest of all files the charm is built from.
+
+    Args:
+        root: the charm source root directory.
+
+    Returns:
+        Hex digest of the charm sources.
+    """
+    files = [root / name for name in CHARM_SOURCES]
+    for source_dir in CHARM_SOURCE_DIRS:
+        files.extend(
+            path
+            for path in (root / source_dir).rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        )
+    digest = hashlib.sha256()
+    for file in sorted(files):
+        digest.update(str(file.relative_to(root)).encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+@pytest_asyncio.fixture(scope="module", name="build_charm")
+async def build_charm_fixture(
+    ops_test: pytest_operator.plugin.OpsTest,
+    charm_file: typing.Optional[str],
+    pytestconfig: pytest.Config,
+):
+    """Helper function to get the Spring Boot charm file, building it only when necessary."""
+
+    async def _build_charm() -> typing.Union[str, pathlib.Path]:
+        """Get the pre-built charm file, the cached charm file or build a new one.
+
+        With --charm-cache, built charm files are cached by the digest of the charm sources, so
+        re-runs with unchanged sources skip the build. The digest doesn't cover the unpinned
+        Python dependencies nor the charmcraft version, so the cache is opt-in.
+
+        Returns:
+            Path to the Spring Boot charm file.
+        """
+        if charm_file:
+            return charm_file
+        root = pathlib.Path(".").resolve()
+        if not pytestconfig.getoption("--charm-cache"):
+            return await ops_test.build_charm(root)
+        cached_charm = CHARM_CACHE_DIR / f"spring-boot-k8s-{_charm_source_digest(root)}.charm"
+        if cached_charm.exists():
+            return cached_charm
+        charm = await ops_test.build_charm(root)
+        CHARM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copy(charm, cached_charm)
+        return charm
+
+    yield _build_charm
+
 
 @pytest_asyncio.fixture(scope="module", name="get_unit_ip_list")
 async def get_unit_ip_list_fixture(
     ops_test: pytest_operator.plugin.OpsTest,
 ):
     """Helper function to retrieve unit ip addresses."""
+    status_cache: typing.Dict[str, typing.Any] = {}
 
     async def _get_unit_ip_list(app_name: str) -> typing.List[str]:
         """Get most recent charm application unit IPs.
 
+        The model status query is cached for a short time, so consecutive or concurrent calls
+        for different applications share one status query.
+
         Args:
             app_name: the name of the charm application.
 
@@ -24,11 +102,13 @@ async def get_unit_ip_list_fixture(
             IP of all units in the Charm application, sorted by unit number.
         """
         assert ops_test.model
-        status = await ops_test.model.get_status()
+        now = time.monotonic()
+        if "status" not in status_cache or now - status_cache["time"] >= STATUS_CACHE_TTL:
+            status_cache["status"] = asyncio.ensure_future(ops_test.model.get_status())
+            status_cache["time"] = now
+        status = await status_cache["status"]
         units = status.applications[app_name].units
-        ip_list = []
-        for key in sorted(units.keys(), key=lambda n: int(n.split("/")[-1])):
-            ip_list.append(units[key].address)
-        return ip_list
+        unit_names = sorted(units, key=lambda name: int(name.rpartition("/")[2]))
+        return [units[unit_name].address for unit_name in unit_names]
 
     yield _get_unit_ip_list
@@ -7,10 +7,13 @@
 import asyncio
 import json
 import logging
+import time
+import typing
 
 import ops.model
 import pytest
 import requests
+from juju.model import Model
 from pytest_operator.plugin import OpsTest
 
 logger = logging.getLogger(__name__)
@@ -24,20 +27,105 @@ INGRESS_NAME = "nginx-ingress-integrator"
 
 ACTIVE_STATUS: str = ops.model.ActiveStatus.name  # type: ignore
 
+NEW_SERVER_PORT = 8888
+DEFAULT_SERVER_PORT = 8080
+SERVER_PORT_APP_CONFIG = json.dumps({"server": {"port": NEW_SERVER_PORT}}, separators=(",", ":"))
+GREETING_APP_CONFIG = json.dumps({"greeting": "Bonjour"}, separators=(",", ":"))
+
+# Seconds all units must stay idle before wait_for_idle returns, juju defaults to 15. Used by
+# every test: the charm sets its final status, including the jvm-config dry run result, inside
+# the hook, and the workload restarted by a replan is awaited by polling its HTTP endpoint.
+IDLE_PERIOD = 5
+
+# Shared HTTP session keeping connections to each unit alive across probes
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+
+
+async def http_get(
+    url: str,
+    match: typing.Optional[str] = None,
+    deadline: float = 30,
+    interval: float = 0.25,
+    **kwargs: typing.Any,
+) -> requests.Response:
+    """Poll a URL until it responds successfully or the deadline is reached.
+
+    Args:
+        url: URL to request.
+        match: if set, also keep polling until the response body contains this text.
+        deadline: seconds to keep polling for.
+        interval: seconds to sleep between attempts.
+        kwargs: extra arguments passed to requests.
+
+    Returns:
+        The first matching response, or the last response once the deadline is reached.
+
+    Raises:
+        RequestException: if the last attempt before the deadline failed to connect.
+    """
+    end = time.monotonic() + deadline
+    while True:
+        try:
+            response = await asyncio.to_thread(HTTP_SESSION.get, url, timeout=2, **kwargs)
+        except requests.RequestException:
+            if time.monotonic() >= end:
+                raise
+        else:
+            if response.ok and (match is None or match in response.text):
+                return response
+            if time.monotonic() >= end:
+                return response
+        await asyncio.sleep(interval)
+
+
+async def http_get_all(
+    urls: typing.Iterable[str], match: typing.Optional[str] = None
+) -> typing.List[requests.Response]:
+    """Poll all URLs concurrently until they respond successfully.
+
+    Args:
+        urls: URLs to request.
+        match: if set, also keep polling until the response body contains this text.
+
+    Returns:
+        The responses, in the same order as the URLs.
+    """
+    return await asyncio.gather(*(http_get(url, match=match) for url in urls))
+
+
+async def wait_for_idle(model: Model, **kwargs: typing.Any) -> None:
+    """Wait for the model to settle using a shorter idle period than the juju default.
+
+    Args:
+        model: the model to wait on.
+        kwargs: extra arguments passed to Model.wait_for_idle.
+    """
+    await model.wait_for_idle(idle_period=IDLE_PERIOD, **kwargs)
+
 
 @pytest.mark.abort_on_fail
-async def test_build_and_deploy(ops_test: OpsTest, get_unit_ip_list) -> None:
+async def test_build_and_deploy(ops_test: OpsTest, get_unit_ip_list, build_charm) -> None:
     """
     arrange: none.
     act: build the Spring Boot charm and deploy it.
     assert: Spring Boot application in all units is up and running
     """
     assert ops_test.model
-    # Build and deploy charm from local source folder
-    charm = await ops_test.build_charm(".")
+    # Deploy the ingress charm while building the charm from local source folder, unless a
+    # pre-built or cached charm file is available
+    ingress_deploy = asyncio.create_task(
+        ops_test.model.deploy(INGRESS_NAME, series="focal", trust=True)
+    )
+    try:
+        charm = await build_charm()
+    except BaseException:
+        ingress_deploy.cancel()
+        await asyncio.gather(ingress_deploy, return_exceptions=True)
+        raise
     executable_jar_resources = {"spring-boot-app-image": "ghcr.io/canonical/spring-boot:3.0"}
     buildpack_resources = {"spring-boot-app-image": "ghcr.io/canonical/spring-boot:3.0-layered"}
-    # Deploy the charm and wait for idle
+    # Deploy the charm and wait for idle once all applications are deployed
     await asyncio.gather(
         ops_test.model.deploy(
             charm, resources=executable_jar_resources, application_name=APP_NAME, series="jammy"
@@ -62,16 +150,13 @@ async def test_build_and_deploy(ops_test: OpsTest, get_unit_ip_list) -> None:
             series="jammy",
             constraints={"mem": 512},
         ),
-        ops_test.model.deploy(INGRESS_NAME, series="focal", trust=True),
-        ops_test.model.wait_for_idle(
-            apps=ALL_APP_NAMES + [INGRESS_NAME],
-            status="active",
-        ),
+        ingress_deploy,
     )
-    for name in ALL_APP_NAMES:
-        unit_ips = await get_unit_ip_list(name)
-        for unit_ip in unit_ips:
-            assert requests.get(f"http://{unit_ip}:8080/hello-world", timeout=5).status_code == 200
+    await wait_for_idle(ops_test.model, apps=ALL_APP_NAMES + [INGRESS_NAME], status="active")
+    ip_lists = await asyncio.gather(*(get_unit_ip_list(name) for name in ALL_APP_NAMES))
+    urls = [f"http://{unit_ip}:8080/hello-world" for unit_ips in ip_lists for unit_ip in unit_ips]
+    for response in await http_get_all(urls):
+        assert response.status_code == 200
 
 
 async def test_application_config_server_port(ops_test: OpsTest, get_unit_ip_list) -> None:
@@ -82,22 +167,25 @@ async def test_application_config_server_port(ops_test: OpsTest, get_unit_ip_lis
     assert: Spring Boot applications should change the server port accordingly.
     """
     assert ops_test.model
-    new_port = 8888
-    default_port = 8080
-    for port in (new_port, default_port):
-        app_config = json.dumps({"server": {"port": new_port}}) if port == new_port else ""
+    for port, app_config in (
+        (NEW_SERVER_PORT, SERVER_PORT_APP_CONFIG),
+        (DEFAULT_SERVER_PORT, ""),
+    ):
         await asyncio.gather(
             ops_test.model.applications[APP_NAME].set_config({"application-config": app_config}),
             ops_test.model.applications[BUILDPACK_APP_NAME].set_config(
                 {"application-config": app_config}
             ),
-            ops_test.model.wait_for_idle(apps=[APP_NAME, BUILDPACK_APP_NAME], status="active"),
         )
-        for name in (APP_NAME, BUILDPACK_APP_NAME):
-            unit_ips = await get_unit_ip_list(name)
-            for unit_ip in unit_ips:
-                response = requests.get(f"http://{unit_ip}:{port}/hello-world", timeout=5)
-                assert response.status_code == 200
+        await wait_for_idle(ops_test.model, apps=[APP_NAME, BUILDPACK_APP_NAME], status="active")
+        ip_lists = await asyncio.gather(
+            *(get_unit_ip_list(name) for name in (APP_NAME, BUILDPACK_APP_NAME))
+        )
+        urls = [
+            f"http://{unit_ip}:{port}/hello-world" for unit_ips in ip_lists for unit_ip in unit_ips
+        ]
+        for response in await http_get_all(urls):
+            assert response.status_code == 200
 
 
 async def test_application_config(ops_test: OpsTest, get_unit_ip_list) -> None:
@@ -108,20 +196,22 @@ async def test_application_config(ops_test: OpsTest, get_unit_ip_list) -> None:
         according to the configuration.
     """
     assert ops_test.model
-    app_config = json.dumps({"greeting": "Bonjour"})
     await asyncio.gather(
-        ops_test.model.applications[APP_NAME].set_config({"application-config": app_config}),
+        ops_test.model.applications[APP_NAME].set_config(
+            {"application-config": GREETING_APP_CONFIG}
+        ),
         ops_test.model.applications[BUILDPACK_APP_NAME].set_config(
-            {"application-config": app_config}
+            {"application-config": GREETING_APP_CONFIG}
         ),
-        ops_test.model.wait_for_idle(apps=[APP_NAME, BUILDPACK_APP_NAME], status="active"),
     )
-    for name in (APP_NAME, BUILDPACK_APP_NAME):
-        unit_ips = await get_unit_ip_list(name)
-        for unit_ip in unit_ips:
-            response = requests.get(f"http://{unit_ip}:8080/hello-world", timeout=5)
-            assert response.status_code == 200
-            assert "Bonjour" in response.text
+    await wait_for_idle(ops_test.model, apps=[APP_NAME, BUILDPACK_APP_NAME], status="active")
+    ip_lists = await asyncio.gather(
+        *(get_unit_ip_list(name) for name in (APP_NAME, BUILDPACK_APP_NAME))
+    )
+    urls = [f"http://{unit_ip}:8080/hello-world" for unit_ips in ip_lists for unit_ip in unit_ips]
+    for response in await http_get_all(urls, match="Bonjour"):
+        assert response.status_code == 200
+        assert "Bonjour" in response.text
 
 
 async def test_jvm_config(ops_test: OpsTest, get_unit_ip_list) -> None:
@@ -135,14 +225,17 @@ async def test_jvm_config(ops_test: OpsTest, get_unit_ip_list) -> None:
     await asyncio.gather(
         ops_test.model.applications[APP_NAME].set_config({"jvm-config": jvm_config}),
         ops_test.model.applications[BUILDPACK_APP_NAME].set_config({"jvm-config": jvm_config}),
-        ops_test.model.wait_for_idle(apps=[APP_NAME, BUILDPACK_APP_NAME], status="active"),
     )
-    for name in (APP_NAME, BUILDPACK_APP_NAME):
-        unit_ips = await get_unit_ip_list(name)
-        for unit_ip in unit_ips:
-            response = requests.get(f"http://{unit_ip}:8080/jvm-arguments", timeout=5)
-            assert response.status_code == 200
-            assert response.json() == jvm_config.split()
+    await wait_for_idle(ops_test.model, apps=[APP_NAME, BUILDPACK_APP_NAME], status="active")
+    ip_lists = await asyncio.gather(
+        *(get_unit_ip_list(name) for name in (APP_NAME, BUILDPACK_APP_NAME))
+    )
+    urls = [
+        f"http://{unit_ip}:8080/jvm-arguments" for unit_ips in ip_lists for unit_ip in unit_ips
+    ]
+    for response in await http_get_all(urls, match="-Xmx512M"):
+        assert response.status_code == 200
+        assert response.json() == jvm_config.split()
 
 
 async def test_invalid_jvm_config(ops_test: OpsTest) -> None:
@@ -162,8 +255,8 @@ async def test_invalid_jvm_config(ops_test: OpsTest) -> None:
         ops_test.model.applications[MEM_1G_BUILDPACK_APP_NAME].set_config(
             {"jvm-config": "-Xms256m -Xmx2G"}
         ),
-        ops_test.model.wait_for_idle(apps=ALL_APP_NAMES),
     )
+    await wait_for_idle(ops_test.model, apps=ALL_APP_NAMES, status="blocked")
     for name in (APP_NAME, BUILDPACK_APP_NAME):
         for unit in ops_test.model.applications[name].units:
             assert unit.workload_status == "blocked"
@@ -178,13 +271,11 @@ async def test_invalid_jvm_config(ops_test: OpsTest) -> None:
             )
     await asyncio.gather(
         *(
-            [
-                ops_test.model.applications[app_name].set_config({"jvm-config": ""})
-                for app_name in ALL_APP_NAMES
-            ]
-            + [ops_test.model.wait_for_idle(apps=ALL_APP_NAMES)]
+            ops_test.model.applications[app_name].set_config({"jvm-config": ""})
+            for app_name in ALL_APP_NAMES
         )
     )
+    await wait_for_idle(ops_test.model, apps=ALL_APP_NAMES, status="active")
 
 
 async def test_ingress(ops_test: OpsTest) -> None:
@@ -197,19 +288,17 @@ async def test_ingress(ops_test: OpsTest) -> None:
     """
     assert ops_test.model
     await ops_test.model.add_relation(APP_NAME, INGRESS_NAME)
-    await ops_test.model.wait_for_idle(status=ACTIVE_STATUS)
+    await wait_for_idle(ops_test.model, status=ACTIVE_STATUS)
 
-    response = requests.get("http://127.0.0.1/hello-world", headers={"Host": APP_NAME}, timeout=5)
+    response = await http_get("http://127.0.0.1/hello-world", headers={"Host": APP_NAME})
     assert response.status_code == 200
     assert "world" in response.text.lower()
 
     new_hostname = "new-hostname"
     application = ops_test.model.applications[APP_NAME]
     await application.set_config({"ingress-hostname": new_hostname})
-    await ops_test.model.wait_for_idle(status=ACTIVE_STATUS)
-    response = requests.get(
-        "http://127.0.0.1/hello-world", headers={"Host": new_hostname}, timeout=5
-    )
+    await wait_for_idle(ops_test.model, status=ACTIVE_STATUS)
+    response = await http_get("http://127.0.0.1/hello-world", headers={"Host": new_hostname})
     assert response.status_code == 200
     assert "world" in response.text.lower()
 
@@ -219,9 +308,7 @@ async def test_ingress(ops_test: OpsTest) -> None:
     await ops_test.model.applications[INGRESS_NAME].set_config({"rewrite-target": ""})
 
     await application.set_config({"ingress-strip-url-prefix": "/foo"})
-    await ops_test.model.wait_for_idle(status=ACTIVE_STATUS)
-    response = requests.get(
-        "http://127.0.0.1/foo/hello-world", headers={"Host": new_hostname}, timeout=5
-    )
+    await wait_for_idle(ops_test.model, status=ACTIVE_STATUS)
+    response = await http_get("http://127.0.0.1/foo/hello-world", headers={"Host": new_hostname})
     assert response.status_code == 200
     assert "world" in response.text.lower()
@@ -10,7 +10,7 @@ import pytest
 
 from charm import SpringBootCharm
 
-from .spring_boot_patch import SpringBootPatch
+from .spring_boot_patch import OCIImageMock, SpringBootPatch
 
 
 @pytest.fixture(name="harness")
@@ -32,3 +32,29 @@ def patch_fixture(harness: ops.testing.Harness):
 
     if patch.started:
         patch.stop()
+
+
+@pytest.fixture(scope="session", name="executable_jar_image")
+def executable_jar_image_fixture() -> OCIImageMock:
+    """Simulated OCI image with a single executable jar file in /app, shared by all tests.
+
+    Container mocks copy the image content, so tests can safely modify their container files.
+    """
+    return OCIImageMock.builder().add_file("/app/test.jar", b"").build()
+
+
+@pytest.fixture(scope="session", name="buildpack_image")
+def buildpack_image_fixture() -> OCIImageMock:
+    """Simulated OCI image mimicking a Spring Boot application image created by buildpack."""
+    return (
+        OCIImageMock.builder()
+        .add_file("/layers/paketo-buildpacks_bellsoft-liberica/jre/bin/java", b"")
+        .add_file("/workspace/org/springframework/boot/loader/JarLauncher.class", b"")
+        .build()
+    )
+
+
+@pytest.fixture(scope="session", name="empty_image")
+def empty_image_fixture() -> OCIImageMock:
+    """Simulated OCI image without any file."""
+    return OCIImageMock.builder().build()
@@ -2,10 +2,11 @@
 # See LICENSE file for licensing details.
 
 """The mocking and patching system for Spring Boot charm unit tests."""
-import io
-import pathlib
-import tarfile
-import tempfile
+import collections
+import contextvars
+import fnmatch
+import itertools
+import posixpath
 import typing
 from unittest.mock import MagicMock, _patch, patch
 
@@ -13,8 +14,24 @@ import kubernetes.client
 import ops.model
 import ops.pebble
 
+# Lightweight stand-in for ops.pebble.FileInfo returned by the list_files mocks
+FileInfo = collections.namedtuple("FileInfo", ["path", "name"])
 
-class OCIImageMock:
+
+def _add_parent_dirs(dirs: typing.Set[str], path: str) -> None:
+    """Add all missing parent directories of an absolute path to a set of directories.
+
+    Args:
+        dirs: the set of directories to update, it must contain the root directory.
+        path: the absolute path, without trailing slash.
+    """
+    parent = posixpath.dirname(path)
+    while parent not in dirs:
+        dirs.add(parent)
+        parent = posixpath.dirname(parent)
+
+
+class OCIImageMock:  # pylint: disable=too-few-public-methods
     """The class to simulate an OCI image."""
 
     class OCIImageMockBuilder:
@@ -22,9 +39,8 @@ class OCIImageMock:
 
         def __init__(self) -> None:
             """Initialize the :class:`OCIImageMockBuilder` instance."""
-            self.tar_file_obj = io.BytesIO()
-            # pylint: disable=consider-using-with
-            self.tar_file = tarfile.TarFile(mode="w", fileobj=self.tar_file_obj)
+            self.files: typing.Dict[str, bytes] = {}
+            self.dirs: typing.Set[str] = {"/"}
 
         def add_file(self, path: str, content: bytes) -> "OCIImageMock.OCIImageMockBuilder":
             """Add a file to the simulated OCI image.
@@ -35,9 +51,21 @@ class OCIImageMock:
                 content: file content in bytes.
             """
             assert path.startswith("/") and not path.endswith("/")
-            tar_info = tarfile.TarInfo(path.removeprefix("/"))
-            tar_info.size = len(content)
-            self.tar_file.addfile(tar_info, io.BytesIO(content))
+            self.files[path] = content
+            _add_parent_dirs(self.dirs, path)
+            return self
+
+        def add_files(self, files: typing.Dict[str, bytes]) -> "OCIImageMock.OCIImageMockBuilder":
+            """Add multiple files to the simulated OCI image.
+
+            Args:
+                files: mapping from the absolute path of each file to the file content, see
+                    :meth:`add_file`.
+            """
+            assert all(path.startswith("/") and not path.endswith("/") for path in files)
+            self.files.update(files)
+            for path in files:
+                _add_parent_dirs(self.dirs, path)
             return self
 
         def add_dir(self, path: str) -> "OCIImageMock.OCIImageMockBuilder":
@@ -48,33 +76,26 @@ class OCIImageMock:
                     end with a slash. All parent directories will be created if not exist.
             """
             assert path.startswith("/") and path.endswith("/")
-            tar_info = tarfile.TarInfo(path.removeprefix("/"))
-            tar_info.type = tarfile.DIRTYPE
-            self.tar_file.addfile(tar_info)
+            path = path.rstrip("/")
+            _add_parent_dirs(self.dirs, path)
+            self.dirs.add(path)
             return self
 
         def build(self) -> "OCIImageMock":
             """Create the :class:`OCIImageMock` instance."""
-            self.tar_file.close()
-            return OCIImageMock(self.tar_file_obj.getvalue())
+            return OCIImageMock(files=self.files, dirs=self.dirs)
 
-    def __init__(self, files_tar: bytes):
+    def __init__(self, files: typing.Dict[str, bytes], dirs: typing.Set[str]):
         """Initialize the OCIImageMock instance.
 
         Args:
-            files_tar: files_tar is an uncompressed tar file in bytes. Every file and directory
-                inside the tar file represents a file or directory inside the mock OCI image.
+            files: mapping from the absolute path of every file inside the mock OCI image to
+                the file content.
+            dirs: absolute paths, without trailing slash, of every directory inside the mock OCI
+                image.
         """
-        # pylint: disable=consider-using-with
-        self.files_tar = tarfile.TarFile(mode="r", fileobj=io.BytesIO(files_tar))
-
-    def extract_to(self, path: str) -> None:
-        """Extract the content (files and directories) of the simulated OCI image to a directory.
-
-        Args:
-            path: path to the output directory.
-        """
-        self.files_tar.extractall(path)  # nosec
+        self.files = dict(files)
+        self.dirs = set(dirs)
 
     @classmethod
     def builder(cls) -> "OCIImageMock.OCIImageMockBuilder":
@@ -91,46 +112,48 @@ class ContainerFileSystemMock:
         Args:
             image: The mocking OCI image for this container.
         """
-        self.tempdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
-        self.tempdir_path = pathlib.Path(self.tempdir.name)
-        image.extract_to(self.tempdir.name)
+        self.files = dict(image.files)
+        self.dirs = set(image.dirs)
 
-    def _path_convert(self, path: str) -> pathlib.Path:
-        """Convert an absolute path to a path in the temporary directory, like chroot."""
-        return self.tempdir_path / path.removeprefix("/")
+    @staticmethod
+    def _path_normalize(path: str) -> str:
+        """Remove the trailing slash of an absolute path, except for the root directory."""
+        return path.rstrip("/") or "/"
 
     def push(self, path: str, source: bytes) -> None:
         """Mock function for :meth:`ops.model.Container.push`."""
-        converted_path = self._path_convert(path)
-        converted_path.parent.mkdir(exist_ok=True)
-        converted_path.write_bytes(source)
+        path = self._path_normalize(path)
+        _add_parent_dirs(self.dirs, path)
+        self.files[path] = source
 
-    def list_files(self, path: str) -> typing.List[MagicMock]:
+    def list_files(self, path: str, pattern: typing.Optional[str] = None) -> typing.List[FileInfo]:
         """Mock function for :meth:`ops.model.Container.list_files`."""
-        converted_path = self._path_convert(path)
-        file_list = []
-        try:
-            dir_iter = converted_path.iterdir()
-        except FileNotFoundError as exc:
+        path = self._path_normalize(path)
+        if path not in self.dirs:
             raise ops.pebble.APIError(
                 body={},
                 code=404,
                 status="",
-                message=f"stat {converted_path}: no such file or directory",
-            ) from exc
-        for file in dir_iter:
-            file_info = MagicMock()
-            file_info.name = file.name
-            file_list.append(file_info)
+                message=f"stat {path}: no such file or directory",
+            )
+        file_list = []
+        for file in itertools.chain(self.files, self.dirs):
+            if file == path or posixpath.dirname(file) != path:
+                continue
+            name = posixpath.basename(file)
+            if pattern is not None and not fnmatch.fnmatch(name, pattern):
+                continue
+            file_list.append(FileInfo(path=file, name=name))
         return file_list
 
     def isdir(self, path: str) -> bool:
         """Mock function for :meth:`ops.model.Container.isdir`."""
-        return self._path_convert(path).is_dir()
+        return self._path_normalize(path) in self.dirs
 
     def exists(self, path: str) -> bool:
         """Mock function for :meth:`ops.model.Container.exists`."""
-        return self._path_convert(path).exists()
+        path = self._path_normalize(path)
+        return path in self.files or path in self.dirs
 
 
 class ContainerProcessMock:
@@ -138,8 +161,33 @@ class ContainerProcessMock:
 
     def __init__(self):
         """Initialize the ContainerProcessMock instance."""
+        self._prefix_handlers: typing.Dict[typing.Tuple[str, ...], typing.Callable] = {}
+        self._prefix_lengths: typing.List[int] = []
         self._handlers = []
 
+    def register_command(
+        self,
+        command_prefix: typing.Tuple[str, ...],
+        handler: typing.Callable[
+            [typing.List[str], typing.Dict[str, str]], typing.Tuple[int, str, str]
+        ],
+    ) -> None:
+        """Add a handler for commands starting with certain arguments, longest prefix rules.
+
+        The executable is also matched by its basename, so ("java",) handles
+        ["/opt/jre/bin/java", ...] as well. Prefix handlers take precedence over the handlers
+        added by :meth:`register_command_handler`.
+
+        Args:
+            command_prefix: the leading arguments of the commands to handle, e.g. ("java",).
+            handler: handler function to mock the command execution, see
+                :meth:`register_command_handler`.
+        """
+        self._prefix_handlers[command_prefix] = handler
+        if len(command_prefix) not in self._prefix_lengths:
+            self._prefix_lengths.append(len(command_prefix))
+            self._prefix_lengths.sort(reverse=True)
+
     def register_command_handler(
         self,
         match: typing.Callable[[typing.List[str]], bool],
@@ -159,14 +207,26 @@ class ContainerProcessMock:
         """
         self._handlers.append((match, handler))
 
+    def _find_handler(self, command: typing.List[str]) -> typing.Optional[typing.Callable]:
+        """Find the handler for a command, see :meth:`register_command` for the precedence."""
+        commands = [command]
+        if command and posixpath.basename(command[0]) != command[0]:
+            commands.append([posixpath.basename(command[0]), *command[1:]])
+        for prefix_length in self._prefix_lengths:
+            for candidate in commands:
+                handler = self._prefix_handlers.get(tuple(candidate[:prefix_length]))
+                if handler is not None:
+                    return handler
+        for match, handler in reversed(self._handlers):
+            if match(command):
+                return handler
+        return None
+
     # the mock function signature must match ops.model.Container.exec
     # pylint: disable=unused-argument
     def exec(self, command: typing.List[str], environment=None, timeout=None):
         """Mock function for :meth:`ops.model.Container.exec`."""
-        handler = None
-        for match, _handler in self._handlers:
-            if match(command):
-                handler = _handler
+        handler = self._find_handler(command)
         if handler is None:
             raise RuntimeError(f"Unknown command: {repr(command)}")
         exit_code, stdout, stderr = handler(command, environment if environment else {})
@@ -195,6 +255,7 @@ class ContainerMock:
         self.file_system_mock = ContainerFileSystemMock(image=image)
         self.process_mock = ContainerProcessMock()
         self._original_container = original_container
+        self._checks: typing.Dict[str, ops.pebble.Check] = {}
         # The _pebble attribute is needed by harness
         self._pebble = original_container._pebble
 
@@ -202,9 +263,9 @@ class ContainerMock:
         """Mock function for :meth:`ops.model.Container.push`."""
         return self.file_system_mock.push(path=path, source=source)
 
-    def list_files(self, path: str) -> typing.List[MagicMock]:
+    def list_files(self, path: str, pattern: typing.Optional[str] = None) -> typing.List[FileInfo]:
         """Mock function for :meth:`ops.model.Container.list_files`."""
-        return self.file_system_mock.list_files(path)
+        return self.file_system_mock.list_files(path, pattern=pattern)
 
     def isdir(self, path: str) -> bool:
         """Mock function for :meth:`ops.model.Container.isdir`."""
@@ -218,9 +279,22 @@ class ContainerMock:
         """Mock function for :meth:`ops.model.Container.can_connect`."""
         return self._original_container.can_connect()
 
-    def add_layer(self, *args: typing.Any, **kwargs: typing.Any) -> None:
-        """Mock function for :meth:`ops.model.Container.add_layer`."""
-        return self._original_container.add_layer(*args, **kwargs)
+    def add_layer(self, label: str, layer: typing.Any, combine: bool = False) -> None:
+        """Mock function for :meth:`ops.model.Container.add_layer`.
+
+        Older versions of the harness drop the pebble checks, so the checks with replace
+        override are recorded here for :meth:`get_plan`.
+        """
+        layer_obj = layer if isinstance(layer, ops.pebble.Layer) else ops.pebble.Layer(layer)
+        self._checks.update(layer_obj.checks)
+        return self._original_container.add_layer(label, layer, combine=combine)
+
+    def get_plan(self) -> ops.pebble.Plan:
+        """Mock function for :meth:`ops.model.Container.get_plan`."""
+        plan = self._original_container.get_plan()
+        if not plan.checks:
+            plan.checks.update(self._checks)
+        return plan
 
     def replan(self) -> None:
         """Mock function for :meth:`ops.model.Container.replan`."""
@@ -231,6 +305,20 @@ class ContainerMock:
         return self.process_mock.exec(command=command, environment=environment, timeout=timeout)
 
 
+_ORIGINAL_GET_CONTAINER = ops.model.Unit.get_container
+_current_patch: contextvars.ContextVar[
+    typing.Optional["SpringBootPatch"]
+] = contextvars.ContextVar("current_patch", default=None)
+
+
+def _get_container(unit: ops.model.Unit, container_name: str) -> ops.model.Container:
+    """Replacement for :meth:`ops.model.Unit.get_container` dispatching to the started patch."""
+    current_patch = _current_patch.get()
+    if current_patch is None:
+        return _ORIGINAL_GET_CONTAINER(unit, container_name)
+    return current_patch.get_container(unit, container_name)  # type: ignore
+
+
 class SpringBootPatch:
     """The overall patch system for Spring Boot charm unit tests."""
 
@@ -239,33 +327,31 @@ class SpringBootPatch:
         self.container_mocks: typing.Dict[str, ContainerMock] = {}
         self.images: typing.Dict[str, OCIImageMock] = {}
         self._patches: typing.List[_patch] = []
-        self._patches.append(
-            patch.multiple(
-                ops.model.Unit,
-                get_container=self._gen_get_container_mock(ops.model.Unit.get_container),
-            )
-        )
         self._container_mock_callback: typing.Dict[
             str, typing.Callable[[ContainerMock], typing.Any]
         ] = {}
+        self._current_patch_token: typing.Optional[contextvars.Token] = None
         self.started = False
 
-    def _gen_get_container_mock(
-        self, original_get_container: typing.Callable[[ops.model.Unit, str], ops.model.Container]
-    ) -> typing.Callable[[ops.model.Unit, str], ContainerMock]:
-        """Create a mock function for :meth:`ops.model.Unit.get_container`."""
-
-        def _get_container_mock(_self: ops.model.Unit, container_name: str) -> ContainerMock:
-            if container_name in self.container_mocks:
-                return self.container_mocks[container_name]
-            original_container = original_get_container(_self, container_name)
-            container_mock = ContainerMock(original_container, self.images[container_name])
-            if container_name in self._container_mock_callback:
-                self._container_mock_callback[container_name](container_mock)
-            self.container_mocks[container_name] = container_mock
-            return container_mock
+    def get_container(self, unit: ops.model.Unit, container_name: str) -> ContainerMock:
+        """Mock function for :meth:`ops.model.Unit.get_container`.
 
-        return _get_container_mock
+        Args:
+            unit: the unit the container belongs to.
+            container_name: name of the container.
+
+        Returns:
+            The container mock for the container name, created on first use.
+        """
+        container_mock = self.container_mocks.get(container_name)
+        if container_mock is not None:
+            return container_mock
+        original_container = _ORIGINAL_GET_CONTAINER(unit, container_name)
+        container_mock = ContainerMock(original_container, self.images[container_name])
+        if container_name in self._container_mock_callback:
+            self._container_mock_callback[container_name](container_mock)
+        self.container_mocks[container_name] = container_mock
+        return container_mock
 
     def start(
         self,
@@ -286,29 +372,30 @@ class SpringBootPatch:
         """
         self.started = True
         self.images = images
+        self._current_patch_token = _current_patch.set(self)
         if container_mock_callback:
             self._container_mock_callback = container_mock_callback
+        self._patches.append(patch.multiple(ops.model.Unit, get_container=_get_container))
         self._patches.append(patch.multiple(kubernetes.config, load_incluster_config=MagicMock()))
-        kubernetes_pod_mock = MagicMock()
-        kubernetes_spec_mock = MagicMock()
-        kubernetes_container_mock = MagicMock()
-        kubernetes_charm_container_mock = MagicMock()
-        kubernetes_resources_mock = MagicMock()
-        kubernetes_pod_mock.spec = kubernetes_spec_mock
-        kubernetes_spec_mock.containers = [
-            kubernetes_charm_container_mock,
-            kubernetes_container_mock,
-        ]
-        kubernetes_container_mock.name = "spring-boot-app"
-        kubernetes_charm_container_mock.name = "charm"
-        kubernetes_container_mock.resources = kubernetes_resources_mock
-        kubernetes_resources_mock.limits = (
-            None if memory_constraint is None else {"memory": memory_constraint}
+        kubernetes_pod = kubernetes.client.V1Pod(
+            spec=kubernetes.client.V1PodSpec(
+                containers=[
+                    kubernetes.client.V1Container(name="charm"),
+                    kubernetes.client.V1Container(
+                        name="spring-boot-app",
+                        resources=kubernetes.client.V1ResourceRequirements(
+                            limits=None
+                            if memory_constraint is None
+                            else {"memory": memory_constraint}
+                        ),
+                    ),
+                ]
+            )
         )
         self._patches.append(
             patch.multiple(
                 kubernetes.client.CoreV1Api,
-                read_namespaced_pod=MagicMock(return_value=kubernetes_pod_mock),
+                read_namespaced_pod=MagicMock(return_value=kubernetes_pod),
             )
         )
 
@@ -319,6 +406,9 @@ class SpringBootPatch:
         """Stop the patch system."""
         self.started = False
         self._container_mock_callback = {}
+        if self._current_patch_token is not None:
+            _current_patch.reset(self._current_patch_token)
+            self._current_patch_token = None
         for patch_ in self._patches:
             patch_.stop()
         self._patches = []
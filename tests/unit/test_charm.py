@@ -4,11 +4,9 @@
 # pylint: disable=duplicate-code,protected-access
 
 """Spring Boot charm unit tests."""
-import json
 import typing
+import unittest.mock
 
-import ops.charm
-import ops.pebble
 import pytest
 from ops.model import ActiveStatus, BlockedStatus
 from ops.testing import Harness
@@ -16,6 +14,41 @@ from unit.spring_boot_patch import OCIImageMock, SpringBootPatch
 
 import exceptions
 
+SERVER_PORT_APP_CONFIG = '{"server": {"port": 8888}}'
+SERVER_ADDRESS_APP_CONFIG = '{"server": {"address": "0.0.0.0"}}'
+
+
+def _expected_layer(
+    port: int = 8080, environment: typing.Optional[typing.Dict[str, str]] = None
+) -> dict:
+    """Build the expected pebble layer for the /app/test.jar executable jar application.
+
+    Args:
+        port: the Spring Boot server port used by the health check.
+        environment: the expected environment variables of the service.
+
+    Returns:
+        The expected pebble layer as a dict.
+    """
+    return {
+        "services": {
+            "spring-boot-app": {
+                "override": "replace",
+                "summary": "Spring Boot application service",
+                "command": "java -jar /app/test.jar",
+                "environment": environment or {},
+                "startup": "enabled",
+            }
+        },
+        "checks": {
+            "wordpress-ready": {
+                "override": "replace",
+                "level": "alive",
+                "http": {"url": f"http://localhost:{port}/actuator/health"},
+            },
+        },
+    }
+
 
 def test_spring_boot_pebble_layer(harness: Harness, patch: SpringBootPatch) -> None:
     """
@@ -34,24 +67,7 @@ def test_spring_boot_pebble_layer(harness: Harness, patch: SpringBootPatch) -> N
     harness.begin()
     harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
     spring_boot_layer = harness.charm._generate_spring_boot_layer()
-    assert spring_boot_layer == {
-        "services": {
-            "spring-boot-app": {
-                "override": "replace",
-                "summary": "Spring Boot application service",
-                "command": "java -jar /app/test.jar",
-                "environment": {},
-                "startup": "enabled",
-            }
-        },
-        "checks": {
-            "wordpress-ready": {
-                "override": "replace",
-                "level": "alive",
-                "http": {"url": "http://localhost:8080/actuator/health"},
-            },
-        },
-    }
+    assert spring_boot_layer == _expected_layer()
 
 
 @pytest.mark.parametrize(
@@ -61,6 +77,7 @@ def test_spring_boot_pebble_layer(harness: Harness, patch: SpringBootPatch) -> N
         (["/app/test.json"], "No jar file found in /app"),
         ([], "Unknown Java application type"),
     ],
+    ids=["multiple-jars", "no-jar", "no-app-dir"],
 )
 def test_incorrect_app_directory_content(
     harness: Harness, patch: SpringBootPatch, filenames: typing.Sequence[str], message: str
@@ -70,15 +87,15 @@ def test_incorrect_app_directory_content(
     act: generate the Spring Boot container pebble layer configuration.
     assert: Spring Boot charm should raise ReconciliationError with different reasons accordingly.
     """
-    image_mock_builder = OCIImageMock.builder()
-    for file in filenames:
-        image_mock_builder.add_file(file, b"")
-
-    patch.start({"spring-boot-app": image_mock_builder.build()})
+    patch.start(
+        {
+            "spring-boot-app": OCIImageMock.builder()
+            .add_files(dict.fromkeys(filenames, b""))
+            .build()
+        }
+    )
     harness.begin()
     harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
-    for filename in filenames:
-        harness.charm.unit.get_container("spring-boot-app").push(filename, source=b"")
     with pytest.raises(exceptions.ReconciliationError) as exception_info:
         harness.charm._generate_spring_boot_layer()
     assert exception_info.value.new_status.message == message
@@ -100,71 +117,71 @@ def test_executable_jar_application_start(harness: Harness, patch: SpringBootPat
     )
     harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
     harness.begin_with_initial_hooks()
-    assert isinstance(harness.model.unit.status, ops.charm.model.ActiveStatus)
+    assert isinstance(harness.model.unit.status, ActiveStatus)
 
 
-def test_buildpack_application_start(harness: Harness, patch: SpringBootPatch) -> None:
+def test_buildpack_application_start(
+    harness: Harness, patch: SpringBootPatch, buildpack_image: OCIImageMock
+) -> None:
     """
     arrange: provide a simulated OCI image mimicking a Spring Boot application image created by
         buildpack.
     act: start the charm.
     assert: Spring Boot charm should finish the reconciliation process without an error.
     """
-    patch.start(
-        {
-            "spring-boot-app": OCIImageMock.builder()
-            .add_file("/layers/paketo-buildpacks_bellsoft-liberica/jre/bin/java", b"")
-            .add_file("/workspace/org/springframework/boot/loader/JarLauncher.class", b"")
-            .build()
-        }
-    )
+    patch.start({"spring-boot-app": buildpack_image})
     harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
     harness.begin_with_initial_hooks()
-    assert isinstance(harness.model.unit.status, ops.charm.model.ActiveStatus)
+    assert isinstance(harness.model.unit.status, ActiveStatus)
 
 
-def test_java_application_type_detection_failure(harness: Harness, patch: SpringBootPatch) -> None:
+def test_java_application_type_detection_failure(
+    harness: Harness, patch: SpringBootPatch, empty_image: OCIImageMock
+) -> None:
     """
     arrange: prepare the simulated Spring Boot application container without any file.
     act: start the charm.
     assert: Spring Boot charm should be in blocking status.
     """
-    patch.start({"spring-boot-app": OCIImageMock.builder().build()})
+    patch.start({"spring-boot-app": empty_image})
     harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
     harness.begin_with_initial_hooks()
-    assert isinstance(harness.model.unit.status, ops.charm.model.BlockedStatus)
+    assert isinstance(harness.model.unit.status, BlockedStatus)
 
 
-def test_spring_boot_config_port(harness: Harness, patch: SpringBootPatch) -> None:
+def test_spring_boot_config_port(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+) -> None:
     """
     arrange: provide a simulated Spring Boot application image.
     act: update the application-config to update the Spring Boot server port.
     assert: Spring Boot charm should use a pebble layer with correct environment and
         healthcheck options.
     """
-    patch.start({"spring-boot-app": OCIImageMock.builder().add_file("/app/test.jar", b"").build()})
+    patch.start({"spring-boot-app": executable_jar_image})
     harness.begin_with_initial_hooks()
-    harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
-    harness.update_config({"application-config": json.dumps({"server": {"port": 8888}})})
-    assert harness.charm._generate_spring_boot_layer()["checks"] == {
-        "wordpress-ready": {
-            "override": "replace",
-            "level": "alive",
-            "http": {"url": "http://localhost:8888/actuator/health"},
-        },
-    }
-    container = harness.model.unit.containers["spring-boot-app"]
-    assert container.get_plan().to_dict() == {
-        "services": {
-            "spring-boot-app": {
-                "override": "replace",
-                "summary": "Spring Boot application service",
-                "environment": {"SPRING_APPLICATION_JSON": '{"server": {"port": 8888}}'},
-                "command": "java -jar /app/test.jar",
-                "startup": "enabled",
-            }
-        }
-    }
+    container = harness.model.unit.get_container("spring-boot-app")
+    harness.update_config({"application-config": SERVER_PORT_APP_CONFIG})
+    expected_layer = _expected_layer(
+        port=8888, environment={"SPRING_APPLICATION_JSON": '{"server":{"port":8888}}'}
+    )
+    assert harness.charm._generate_spring_boot_layer() == expected_layer
+    assert container.get_plan().to_dict() == expected_layer
+
+
+def test_spring_boot_config_without_port(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+) -> None:
+    """
+    arrange: provide a simulated Spring Boot application image.
+    act: update the application-config with server configuration that has no port.
+    assert: Spring Boot charm should use the default server port.
+    """
+    patch.start({"spring-boot-app": executable_jar_image})
+    harness.update_config({"application-config": SERVER_ADDRESS_APP_CONFIG})
+    harness.begin_with_initial_hooks()
+    assert isinstance(harness.model.unit.status, ActiveStatus)
+    assert harness.charm._spring_boot_port() == 8080
 
 
 @pytest.mark.parametrize(
@@ -173,18 +190,22 @@ def test_spring_boot_config_port(harness: Harness, patch: SpringBootPatch) -> No
         ("a", "Invalid application-config value, expecting JSON"),
         ("1", "Invalid application-config value, expecting an object in JSON"),
     ],
+    ids=["not-json", "not-object"],
 )
 def test_invalid_application_config(
-    harness: Harness, patch: SpringBootPatch, config: str, message: str
+    harness: Harness,
+    patch: SpringBootPatch,
+    executable_jar_image: OCIImageMock,
+    config: str,
+    message: str,
 ) -> None:
     """
     arrange: provide a simulated Spring Boot application image.
     act: update the application-config with an invalid value.
     assert: Spring Boot charm should enter blocked status.
     """
-    patch.start({"spring-boot-app": OCIImageMock.builder().add_file("/app/test.jar", b"").build()})
+    patch.start({"spring-boot-app": executable_jar_image})
     harness.begin_with_initial_hooks()
-    harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
     harness.update_config({"application-config": config})
     status = harness.model.unit.status
     assert isinstance(status, BlockedStatus)
@@ -192,7 +213,9 @@ def test_invalid_application_config(
 
 
 @pytest.mark.parametrize("jvm_config", ["-Xmx1G", "-Xms200k", "-Xmx10m -Xms4096"])
-def test_jvm_config(harness: Harness, patch: SpringBootPatch, jvm_config):
+def test_jvm_config(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock, jvm_config
+):
     """
     arrange: provide a simulated Spring Boot application image.
     act: update the jvm-config with a valid value.
@@ -200,20 +223,19 @@ def test_jvm_config(harness: Harness, patch: SpringBootPatch, jvm_config):
         pebble layer.
     """
     patch.start(
-        {"spring-boot-app": OCIImageMock.builder().add_file("/app/test.jar", b"").build()},
+        {"spring-boot-app": executable_jar_image},
         container_mock_callback={
-            "spring-boot-app": lambda container: container.process_mock.register_command_handler(
-                lambda command: command[0].endswith("java"),
+            "spring-boot-app": lambda container: container.process_mock.register_command(
+                ("java",),
                 lambda command, environment: (0, "", ""),
             )
         },
     )
     harness.begin_with_initial_hooks()
-    harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
+    container = harness.model.unit.containers["spring-boot-app"]
     harness.update_config({"jvm-config": jvm_config})
     status = harness.model.unit.status
     assert isinstance(status, ActiveStatus)
-    container = harness.model.unit.containers["spring-boot-app"]
     assert (
         container.get_plan().to_dict()["services"]["spring-boot-app"]["environment"][
             "JAVA_TOOL_OPTIONS"
@@ -222,69 +244,156 @@ def test_jvm_config(harness: Harness, patch: SpringBootPatch, jvm_config):
     )
 
 
+def test_jvm_config_validated_once(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+):
+    """
+    arrange: provide a simulated Spring Boot application image and a valid jvm-config.
+    act: run the reconciliation again without changing the jvm-config.
+    assert: Spring Boot charm should only validate the jvm-config with java once.
+    """
+    java_handler = unittest.mock.MagicMock(return_value=(0, "", ""))
+    patch.start(
+        {"spring-boot-app": executable_jar_image},
+        container_mock_callback={
+            "spring-boot-app": lambda container: container.process_mock.register_command(
+                ("java",), java_handler
+            )
+        },
+    )
+    harness.begin_with_initial_hooks()
+    harness.update_config({"jvm-config": "-Xmx1G"})
+    harness.charm.on.config_changed.emit()
+    assert isinstance(harness.model.unit.status, ActiveStatus)
+    assert java_handler.call_count == 1
+
+
+def test_jvm_config_revalidated_on_change(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+):
+    """
+    arrange: provide a simulated Spring Boot application image and a valid jvm-config.
+    act: update the jvm-config with an invalid value after the valid one has been validated.
+    assert: Spring Boot charm should validate the new jvm-config and enter blocking status.
+    """
+    java_handler = unittest.mock.MagicMock(
+        side_effect=lambda command, environment: (0, "", "")
+        if "--invalid" not in environment["JAVA_TOOL_OPTIONS"]
+        else (1, "", "")
+    )
+    patch.start(
+        {"spring-boot-app": executable_jar_image},
+        container_mock_callback={
+            "spring-boot-app": lambda container: container.process_mock.register_command(
+                ("java",), java_handler
+            )
+        },
+    )
+    harness.begin_with_initial_hooks()
+    harness.update_config({"jvm-config": "-Xmx1G"})
+    assert isinstance(harness.model.unit.status, ActiveStatus)
+    harness.update_config({"jvm-config": "-Xmx1G --invalid"})
+    assert java_handler.call_count == 2
+    assert harness.model.unit.status == BlockedStatus("Invalid jvm-config")
+
+
 @pytest.mark.parametrize("jvm_config", ["-Xmx1G --invalid", "-Xmx10m --invalid -Xms4096"])
-def test_invalid_jvm_config(harness: Harness, patch: SpringBootPatch, jvm_config):
+def test_invalid_jvm_config(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock, jvm_config
+):
     """
     arrange: provide a simulated Spring Boot application image.
     act: update the jvm-config with an invalid value.
     assert: Spring Boot charm should enter blocking status.
     """
     patch.start(
-        {"spring-boot-app": OCIImageMock.builder().add_file("/app/test.jar", b"").build()},
+        {"spring-boot-app": executable_jar_image},
         container_mock_callback={
-            "spring-boot-app": lambda container: container.process_mock.register_command_handler(
-                lambda command: command[0].endswith("java"),
+            "spring-boot-app": lambda container: container.process_mock.register_command(
+                ("java",),
                 lambda command, environment: (0, "", "")
                 if "--invalid" not in environment["JAVA_TOOL_OPTIONS"]
                 else (1, "", ""),
             )
         },
     )
-    harness.begin_with_initial_hooks()
-    harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
     harness.update_config({"jvm-config": jvm_config})
+    harness.begin_with_initial_hooks()
     status = harness.model.unit.status
     assert isinstance(status, BlockedStatus)
     assert status.message == "Invalid jvm-config"
 
 
+def test_buildpack_jvm_config(
+    harness: Harness, patch: SpringBootPatch, buildpack_image: OCIImageMock
+):
+    """
+    arrange: provide a simulated Spring Boot application image created by buildpack.
+    act: update the jvm-config.
+    assert: Spring Boot charm should validate the jvm-config with the buildpack java executable.
+    """
+    java_handler = unittest.mock.MagicMock(return_value=(0, "", ""))
+    patch.start(
+        {"spring-boot-app": buildpack_image},
+        container_mock_callback={
+            "spring-boot-app": lambda container: container.process_mock.register_command(
+                ("java",), java_handler
+            )
+        },
+    )
+    harness.update_config({"jvm-config": "-Xmx1G"})
+    harness.begin_with_initial_hooks()
+    assert isinstance(harness.model.unit.status, ActiveStatus)
+    command, environment = java_handler.call_args.args
+    assert command[0] == "/layers/paketo-buildpacks_bellsoft-liberica/jre/bin/java"
+    assert environment == {"JAVA_TOOL_OPTIONS": "-Xmx1G"}
+
+
 @pytest.mark.parametrize(
-    "jvm_config,memory_constraint,okay",
+    "heap_config",
     [
         ("-Xmx1G", None, True),
         ("-Xmx1G", "2Gi", True),
         ("-Xmx10m -Xms4096", "20Mi", True),
         ("-Xms4G", "1Gi", False),
         ("-Xms1G -Xmx4G", "2Gi", False),
+        ("-Xmx1T", "2Gi", False),
+    ],
+    ids=[
+        "xmx-no-limit",
+        "xmx-within-limit",
+        "xms-xmx-within-limit",
+        "xms-exceeds-limit",
+        "xmx-exceeds-limit",
+        "terabyte-xmx-exceeds-limit",
     ],
 )
 def test_jvm_heap_memory_config(
     harness: Harness,
     patch: SpringBootPatch,
-    jvm_config: str,
-    memory_constraint: typing.Optional[str],
-    okay: bool,
+    executable_jar_image: OCIImageMock,
+    heap_config: typing.Tuple[str, typing.Optional[str], bool],
 ):
     """
     arrange: provide a simulated Spring Boot application image and set the container memory
         constraint.
     act: update the heap memory related jvm-config.
-    assert: Spring Boot charm should enter blocking status when the JVM heap memory configurate
+    assert: Spring Boot charm should enter blocking status when the JVM heap memory configuration
         conflicts with the container memory constraint.
     """
+    jvm_config, memory_constraint, okay = heap_config
     patch.start(
-        {"spring-boot-app": OCIImageMock.builder().add_file("/app/test.jar", b"").build()},
+        {"spring-boot-app": executable_jar_image},
         container_mock_callback={
-            "spring-boot-app": lambda container: container.process_mock.register_command_handler(
-                lambda command: command[0].endswith("java"),
+            "spring-boot-app": lambda container: container.process_mock.register_command(
+                ("java",),
                 lambda command, environment: (0, "", ""),
             )
         },
         memory_constraint=memory_constraint,
     )
-    harness.begin_with_initial_hooks()
-    harness.set_can_connect(harness.model.unit.containers["spring-boot-app"], True)
     harness.update_config({"jvm-config": jvm_config})
+    harness.begin_with_initial_hooks()
     status = harness.model.unit.status
     if okay:
         assert isinstance(status, ActiveStatus)
@@ -296,28 +405,117 @@ def test_jvm_heap_memory_config(
         )
 
 
-def test_pebble_ready(harness: Harness, patch: SpringBootPatch):
+def test_pebble_ready(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+):
     """
     arrange: provide a simulated Spring Boot application image.
     act: set pebble as ready.
     assert: the unit should have the ActiveStatus
     """
     patch.start(
-        {"spring-boot-app": OCIImageMock.builder().add_file("/app/test.jar", b"").build()},
+        {"spring-boot-app": executable_jar_image},
+    )
+    harness.begin_with_initial_hooks()
+    harness.container_pebble_ready("spring-boot-app")
+    assert isinstance(harness.model.unit.status, ActiveStatus)
+
+
+def test_unchanged_layer_skip_replan(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+):
+    """
+    arrange: provide a simulated Spring Boot application image and start the charm.
+    act: run the reconciliation again with config-changed and pebble-ready.
+    assert: the unit should not replan since the pebble layer is unchanged.
+    """
+    patch.start(
+        {"spring-boot-app": executable_jar_image},
     )
     harness.begin_with_initial_hooks()
     harness.container_pebble_ready("spring-boot-app")
+    container = harness.charm.unit.get_container("spring-boot-app")
+    replan_mock = unittest.mock.MagicMock()
+    container.replan = replan_mock
+
+    harness.charm.on.config_changed.emit()
+    harness.container_pebble_ready("spring-boot-app")
+    replan_mock.assert_not_called()
     assert isinstance(harness.model.unit.status, ActiveStatus)
 
 
-def test_ingress(harness: Harness, patch: SpringBootPatch):
+def test_changed_layer_replan(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+):
+    """
+    arrange: provide a simulated Spring Boot application image and start the charm.
+    act: change the application-config.
+    assert: the unit should apply the new pebble layer and replan.
+    """
+    patch.start(
+        {"spring-boot-app": executable_jar_image},
+    )
+    harness.begin_with_initial_hooks()
+    container = harness.charm.unit.get_container("spring-boot-app")
+    replan_mock = unittest.mock.MagicMock()
+    container.replan = replan_mock
+
+    harness.update_config({"application-config": SERVER_PORT_APP_CONFIG})
+
+    replan_mock.assert_called_once()
+    assert container.get_plan().services["spring-boot-app"].environment == {
+        "SPRING_APPLICATION_JSON": '{"server":{"port":8888}}'
+    }
+    assert container.get_plan().checks["wordpress-ready"].http == {
+        "url": "http://localhost:8888/actuator/health"
+    }
+    assert isinstance(harness.model.unit.status, ActiveStatus)
+
+
+def test_changed_checks_replan(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+):
+    """
+    arrange: provide a simulated Spring Boot application image, start the charm and change the
+        health check in the pebble plan, as a previous charm revision could have left it.
+    act: run the reconciliation again with config-changed.
+    assert: the unit should apply the pebble layer with the charm health check and replan.
+    """
+    patch.start({"spring-boot-app": executable_jar_image})
+    harness.begin_with_initial_hooks()
+    container = harness.charm.unit.get_container("spring-boot-app")
+    container.add_layer(
+        "spring-boot-app",
+        {
+            "checks": {
+                "wordpress-ready": {
+                    "override": "replace",
+                    "level": "alive",
+                    "http": {"url": "http://localhost:8080/health"},
+                }
+            }
+        },
+        combine=True,
+    )
+    replan_mock = unittest.mock.MagicMock()
+    container.replan = replan_mock
+
+    harness.charm.on.config_changed.emit()
+
+    replan_mock.assert_called_once()
+    assert container.get_plan().checks["wordpress-ready"].http == {
+        "url": "http://localhost:8080/actuator/health"
+    }
+
+
+def test_ingress(harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock):
     """
     arrange: provide a simulated Spring Boot application image.
     act: update charm's ingress configuration.
     assert: the unit should update the ingress relation data accordingly.
     """
     patch.start(
-        {"spring-boot-app": OCIImageMock.builder().add_file("/app/test.jar", b"").build()},
+        {"spring-boot-app": executable_jar_image},
     )
 
     harness.set_model_name("test")
@@ -337,14 +535,35 @@ def test_ingress(harness: Harness, patch: SpringBootPatch):
         "service-port": "8080",
     }
 
-    harness.update_config({"ingress-hostname": "new-hostname"})
+    harness.update_config({"ingress-hostname": "new-hostname", "ingress-strip-url-prefix": "/foo"})
     relation_data = harness.get_relation_data(ingress_relation_id, harness.model.app)
 
     assert relation_data["host"] == "new-hostname"
-
-    harness.update_config({"ingress-strip-url-prefix": "/foo"})
-    relation_data = harness.get_relation_data(ingress_relation_id, harness.model.app)
-
     assert relation_data["rewrite-enabled"] == "true"
     assert relation_data["rewrite-target"] == "/$2"
     assert relation_data["path-routes"] == "/foo(/|$)(.*)"
+
+
+def test_ingress_unchanged(
+    harness: Harness, patch: SpringBootPatch, executable_jar_image: OCIImageMock
+):
+    """
+    arrange: provide a simulated Spring Boot application image and an ingress relation.
+    act: run the reconciliation again without changing the ingress configuration.
+    assert: the unit should not update the ingress relation data.
+    """
+    patch.start(
+        {"spring-boot-app": executable_jar_image},
+    )
+    ingress_relation_id = harness.add_relation("ingress", "ingress")
+    harness.add_relation_unit(ingress_relation_id, "ingress/0")
+    harness.set_leader()
+    harness.begin_with_initial_hooks()
+    harness.container_pebble_ready("spring-boot-app")
+    update_config_mock = unittest.mock.MagicMock()
+    harness.charm.ingress.update_config = update_config_mock
+
+    harness.update_config({"jvm-config": ""})
+
+    update_config_mock.assert_not_called()
+    assert isinstance(harness.model.unit.status, ActiveStatus)